@@ -0,0 +1,135 @@
+"""Checks for the helper cell (cell 0) of notebooks/Hackathon.ipynb."""
+import json
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("duckdb")
+pytest.importorskip("polars")
+pytest.importorskip("requests")
+
+NOTEBOOK = Path(__file__).resolve().parent.parent / "notebooks" / "Hackathon.ipynb"
+
+
+@pytest.fixture(scope="module")
+def helpers():
+    cell = json.loads(NOTEBOOK.read_text())["cells"][0]
+    namespace = {}
+    exec(compile("".join(cell["source"]), str(NOTEBOOK), "exec"), namespace)
+    return namespace
+
+
+@pytest.fixture
+def con(helpers):
+    import duckdb
+
+    # Plain in-memory connection: connect() would also install httpfs, which needs network access
+    con = helpers["DuckDBWrapper"]()
+    con.con = duckdb.connect()
+    con.run_query("CREATE TABLE t AS SELECT range AS a FROM range(5)")
+    yield con
+    con.close()
+
+
+@pytest.mark.parametrize("file_type", ["csv", "parquet", "json"])
+@pytest.mark.parametrize("sql", [
+    "SELECT * FROM t; -- trailing note",
+    "CREATE OR REPLACE VIEW vv AS SELECT * FROM t;\nSELECT * FROM vv",
+])
+def test_export_sql_writes_last_result(con, tmp_path, sql, file_type):
+    con.export(sql, "out", file_type, output_dir=tmp_path)
+    assert (tmp_path / f"out.{file_type}").exists()
+    df = con.run_query(f"SELECT count(*) AS n FROM '{tmp_path / f'out.{file_type}'}'")
+    assert df["n"][0] == 5
+
+
+def test_export_ddl_only_runs_and_skips(con, tmp_path):
+    con.export("CREATE OR REPLACE VIEW only_view AS SELECT 1 AS a", "out", "csv", output_dir=tmp_path)
+    assert not (tmp_path / "out.csv").exists()
+    assert con.run_query("SELECT * FROM only_view").height == 1
+
+
+def test_export_empty_result_is_skipped(con, tmp_path):
+    con.export("SELECT * FROM t WHERE a > 100", "out", "csv", output_dir=tmp_path)
+    assert not (tmp_path / "out.csv").exists()
+
+
+@pytest.fixture
+def flaky_server():
+    """HTTP server that cuts the first `drops` responses off after 10 of 100_000 body bytes."""
+    import threading
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    state = {"hits": 0, "drops": 0}
+    body = b"x" * 100_000
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            state["hits"] += 1
+            self.send_response(200)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            if state["hits"] <= state["drops"]:
+                self.wfile.write(body[:10]); self.wfile.flush()
+                self.close_connection = True
+                return
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_port}", state, body
+    server.shutdown()
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    """Records time.sleep calls (notebook backoff and urllib3 backoff) instead of sleeping."""
+    import time
+
+    calls = []
+    monkeypatch.setattr(time, "sleep", calls.append)
+    return calls
+
+
+def test_download_retries_dropped_body(helpers, flaky_server, sleeps, tmp_path):
+    base_url, state, body = flaky_server
+    state["drops"] = 2
+    paths, names = helpers["download_and_cache_data"](["big.parquet"], base_url, tmp_path)
+    assert state["hits"] == 3
+    assert sleeps == [2, 2]
+    assert names == ["big"] and paths[0].read_bytes() == body
+
+
+def test_download_gives_up_after_three_dropped_bodies(helpers, flaky_server, sleeps, tmp_path):
+    base_url, state, _ = flaky_server
+    state["drops"] = 10
+    paths, names = helpers["download_and_cache_data"](["big.parquet"], base_url, tmp_path)
+    assert state["hits"] == 3
+    assert paths == [] and not (tmp_path / "big.parquet").exists()
+
+
+def test_download_connect_errors_are_retried_only_by_urllib3(helpers, sleeps, monkeypatch, tmp_path):
+    import socket
+
+    import urllib3.util.connection
+
+    # Reserve a port, then close it so every connection attempt is refused
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+
+    attempts = []
+    create_connection = urllib3.util.connection.create_connection
+
+    def counting_create_connection(*args, **kwargs):
+        attempts.append(args[0])
+        return create_connection(*args, **kwargs)
+
+    monkeypatch.setattr(urllib3.util.connection, "create_connection", counting_create_connection)
+    paths, names = helpers["download_and_cache_data"](["big.parquet"], f"http://127.0.0.1:{port}", tmp_path)
+    assert len(attempts) == 4  # 1 + Retry(total=3), no second cycle from the mid-body loop
+    assert 2 not in sleeps
+    assert paths == [] and not (tmp_path / "big.parquet").exists()